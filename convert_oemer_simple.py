@@ -9,6 +9,8 @@ Usage:
     python convert_oemer_simple.py -o ./tflite_models
 """
 
+import gc
+import importlib.util
 import os
 import sys
 import warnings
@@ -21,133 +23,459 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 warnings.filterwarnings('ignore')
 
 # Try importing all required packages
+# Import name -> pip version specifier (pins match TFLITE_CONVERSION_GUIDE.md).
+# onnx_graphsurgeon, sng4onnx and tf_keras are imported by onnx2tf itself.
 PACKAGES_REQUIRED = {
-    'tensorflow': '2.14.0',
-    'torch': '2.0+',
-    'torchvision': '0.15+',
-    'oemer': 'latest',
+    'tensorflow': '==2.19.*',
+    'torch': '>=2.4,<2.7',
+    'torchvision': '>=0.19',
+    'oemer': '',
+    'onnx': '',
+    'onnx2tf': '',
+    'onnx_graphsurgeon': '',
+    'sng4onnx': '',
+    'tf_keras': '',
+    'onnxruntime': '',
+    'onnxconverter_common': '',
 }
 
+# ONNX opsets to try, newest first. 17 adds native LayerNormalization.
+ONNX_OPSETS = (17, 15, 13)
+
+# Max output error, relative to the largest reference output, that a
+# converted model may show against PyTorch, per --quantization
+VALIDATION_TOLERANCE = {"float16": 0.02, "bfloat16": 0.02, "int8": 0.1}
+
+# onnx2tf output suffix to ship per --quantization. float16/bfloat16
+# weights are already rounded in the ONNX graph, so they take the variant
+# onnx2tf left alone (float16 falls back to onnx2tf's own float16 output
+# if the check finds float32 weights); int8 keeps float32 I/O so the
+# app-side preprocessing is unchanged.
+ONNX2TF_OUTPUT = {"float16": "float32", "bfloat16": "float32", "int8": "integer_quant"}
+
+
+class ValidationError(RuntimeError):
+    """A converted model's output does not match the PyTorch reference."""
+
+
 def check_dependencies():
-    """Verify all required packages are installed."""
-    missing = []
-    for package, version in PACKAGES_REQUIRED.items():
-        try:
-            __import__(package)
-        except ImportError:
-            missing.append(f"{package}=={version}")
+    """Verify all required packages are installed (without importing them)."""
+    missing = [
+        f"{package}{version}"
+        for package, version in PACKAGES_REQUIRED.items()
+        if importlib.util.find_spec(package) is None
+    ]
     
     if missing:
         print("❌ Missing required packages:")
         for pkg in missing:
-            print(f"   pip install {pkg}")
+            print(f'   pip install "{pkg}"')
         sys.exit(1)
 
 
-def convert_models():
-    """Convert oemer models to TFLite format."""
+def _cached_download(model_cls, name: str) -> str:
+    """Return a local checkpoint path for an oemer model, downloading it only once."""
+    import shutil
+    import tempfile
+    
+    path = Path.home() / ".cache" / "oemer" / f"{name}.ckpt"
+    if path.exists() and path.stat().st_size > 0:
+        return str(path)
+    
+    source = model_cls.download_pretrained_model()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Copy to a temp file and rename it into place, so an interrupted copy
+    # never leaves a truncated checkpoint that later runs would trust
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".ckpt.tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return str(path)
+
+
+def write_tflite(path: Path, tflite_model) -> None:
+    """Write a flatbuffer unbuffered from a view, without an extra copy."""
+    with memoryview(tflite_model) as mv, open(path, "wb", buffering=0) as f:
+        # Raw unbuffered writes may be short, so keep going until done
+        written = 0
+        while written < len(mv):
+            written += f.write(mv[written:])
+
+
+def model_weights_hash(model, quantization_type: str) -> str:
+    """Return a SHA-256 over a PyTorch model's parameters and its quantization type."""
+    import hashlib
+    
+    digest = hashlib.sha256(
+        b"".join(p.detach().cpu().numpy().tobytes() for p in model.parameters())
+    )
+    digest.update(quantization_type.encode())
+    return digest.hexdigest()
+
+
+def round_to_bfloat16(onnx_model) -> None:
+    """
+    Round every float32 initializer of an ONNX model to bfloat16 precision.
+    
+    TFLite has no bfloat16 tensor type, so the weights stay float32 with the
+    low 16 mantissa bits zeroed (round-to-nearest-even). The result is a
+    float32 model with bf16-rounded weights: same file size and speed as an
+    unquantized conversion, with bfloat16 accuracy.
+    """
+    import numpy as np
+    from onnx import numpy_helper
+    
+    for init in onnx_model.graph.initializer:
+        weights = numpy_helper.to_array(init)
+        if weights.dtype != np.float32:
+            continue
+        bits = weights.view(np.uint32)
+        bits = (bits + 0x7FFF + ((bits >> 16) & 1)) & 0xFFFF0000
+        init.CopyFrom(numpy_helper.from_array(bits.view(np.float32), init.name))
+
+
+def fuse_conv_bn_relu(model) -> int:
+    """
+    Fold BatchNorm2d (and a trailing ReLU) into the preceding Conv2d, in place.
+    
+    Only nn.Sequential containers are scanned, since that is the only place
+    where child order is guaranteed to be execution order.
     
+    Returns:
+        Number of fused groups
+    """
+    import torch
+    from torch.ao.quantization import fuse_modules
+    
+    groups = []
+    for name, module in model.named_modules():
+        if not isinstance(module, torch.nn.Sequential):
+            continue
+        children = list(module.named_children())
+        for i in range(len(children) - 1):
+            (conv_name, conv), (bn_name, bn) = children[i], children[i + 1]
+            if not (isinstance(conv, torch.nn.Conv2d) and isinstance(bn, torch.nn.BatchNorm2d)):
+                continue
+            group = [conv_name, bn_name]
+            if i + 2 < len(children) and isinstance(children[i + 2][1], torch.nn.ReLU):
+                group.append(children[i + 2][0])
+            prefix = f"{name}." if name else ""
+            groups.append([prefix + child for child in group])
+    
+    if groups:
+        fuse_modules(model, groups, inplace=True)
+    return len(groups)
+
+
+def validate_tflite(tflite_path: Path, model, sample_input, quantization_type: str) -> float:
+    """
+    Compare a converted model's output with PyTorch on the same input.
+    
+    Returns:
+        Max output error relative to the largest reference output
+        
+    Raises:
+        ValidationError: If the error exceeds VALIDATION_TOLERANCE[quantization_type]
+    """
+    import numpy as np
     import tensorflow as tf
     import torch
+    
+    interpreter = tf.lite.Interpreter(model_path=str(tflite_path))
+    input_details = interpreter.get_input_details()[0]
+    # onnx2tf converts the model to NHWC
+    x = sample_input.detach().cpu().numpy().transpose(0, 2, 3, 1)
+    interpreter.resize_tensor_input(input_details["index"], x.shape)
+    interpreter.allocate_tensors()
+    interpreter.set_tensor(input_details["index"], x.astype(input_details["dtype"]))
+    interpreter.invoke()
+    y_tflite = interpreter.get_tensor(interpreter.get_output_details()[0]["index"])
+    
+    with torch.no_grad():
+        y_torch = model(sample_input)
+    if isinstance(y_torch, (tuple, list)):
+        y_torch = y_torch[0]
+    y_torch = y_torch.detach().cpu().numpy()
+    if y_torch.ndim == 4:
+        y_torch = y_torch.transpose(0, 2, 3, 1)
+    
+    error = float(
+        np.max(np.abs(y_tflite.astype(np.float32).reshape(y_torch.shape) - y_torch))
+        / (np.max(np.abs(y_torch)) + 1e-6)
+    )
+    if error > VALIDATION_TOLERANCE[quantization_type]:
+        raise ValidationError(
+            f"TFLite output diverges from PyTorch by {error:.3f} - quantization broke the model"
+        )
+    return error
+
+
+def float16_tensor_count(tflite_path: Path) -> int:
+    """Count float16 tensors in a flatbuffer; 0 means weights stayed float32."""
     import numpy as np
-    from pathlib import Path
+    import tensorflow as tf
     
-    print("🎵 oemer → TensorFlow Lite Converter")
-    print("=" * 60)
+    interpreter = tf.lite.Interpreter(model_path=str(tflite_path))
+    return sum(
+        1 for detail in interpreter.get_tensor_details()
+        if detail["dtype"] == np.float16
+    )
+
+
+def onnx_to_tflite(onnx_file: Path, output_folder: Path, integer_quant: bool = False) -> None:
+    """Run onnx2tf, writing <onnx stem>_<variant>.tflite files into output_folder."""
+    # Convert ONNX to native NHWC TensorFlow/TFLite. Unlike onnx-tf,
+    # onnx2tf doesn't wrap every Conv2D in NCHW<->NHWC transposes.
+    import onnx2tf
     
-    # Option 1: Try importing oemer models directly
-    try:
-        print("📦 Loading oemer models...")
-        from oemer.models import Staff, Clef
+    onnx2tf.convert(
+        input_onnx_file_path=str(onnx_file),
+        output_folder_path=str(output_folder),
+        copy_onnx_input_output_names_to_tflite=True,
+        output_signaturedefs=True,
+        output_integer_quantized_tflite=integer_quant,
+        non_verbose=True
+    )
+
+
+def convert_model(
+    model,
+    sample_input,
+    model_name: str,
+    output_dir: Path,
+    quantization_type: str = "float16",
+    use_cache: bool = True
+) -> float:
+    """
+    Convert a single PyTorch model to <model_name>.tflite via ONNX and onnx2tf.
+    
+    The ONNX file and onnx2tf output folder are kept next to the output along
+    with a <model_name>.sha256 of the weights and quantization type, so a re-run with
+    unchanged inputs skips the ONNX export and onnx2tf conversion.
+    
+    Returns:
+        Size of the written .tflite file in MB
+    """
+    import shutil
+    import torch
+    
+    onnx_path = output_dir / f"{model_name}.onnx"
+    opt_onnx_path = output_dir / f"{model_name}_opt.onnx"
+    fp16_onnx_path = output_dir / f"{model_name}_fp16.onnx"
+    saved_model_dir = output_dir / f"{model_name}_tf"
+    hash_path = output_dir / f"{model_name}.sha256"
+    output_path = output_dir / f"{model_name}.tflite"
+    # The onnx2tf flatbuffer picked for shipping, kept for cache hits
+    tflite_path = saved_model_dir / f"{model_name}_converted.tflite"
+    
+    weights_hash = model_weights_hash(model, quantization_type)
+    cached = (
+        use_cache
+        and hash_path.exists()
+        and hash_path.read_text().strip() == weights_hash
+        and tflite_path.exists()
+    )
+    
+    if cached:
+        print(f"♻️  Reusing cached {saved_model_dir} (weights unchanged)")
+    else:
+        # Fold BN into convs so no training-only nodes reach the ONNX graph
+        fused = fuse_conv_bn_relu(model)
+        print(f"✅ Fused {fused} Conv-BN(-ReLU) groups")
         
-        # Load pre-trained models
-        staff_model = Staff.load_from_checkpoint(
-            checkpoint_path=Staff.download_pretrained_model()
-        )
-        staff_model.eval()
+        # Trace once without autograd and export the traced graph to ONNX,
+        # stepping down the opset if the newest one lacks an operator.
+        # no_grad rather than inference_mode: the TorchScript tracer needs
+        # version counters, which inference tensors don't have.
+        model.requires_grad_(False)
+        with torch.no_grad():
+            traced = torch.jit.trace(model, sample_input, check_trace=False)
+            for opset in ONNX_OPSETS:
+                try:
+                    torch.onnx.export(
+                        traced, sample_input,
+                        str(onnx_path),
+                        input_names=["input"],
+                        output_names=["output"],
+                        training=torch.onnx.TrainingMode.EVAL,
+                        opset_version=opset,
+                        do_constant_folding=True,
+                        dynamic_axes={"input": {0: "batch"}, "output": {0: "batch"}},
+                        verbose=False
+                    )
+                    break
+                except torch.onnx.errors.UnsupportedOperatorError:
+                    if opset == ONNX_OPSETS[-1]:
+                        raise
+                    print(f"⚠️  opset {opset} unsupported, retrying with a lower opset")
+        print(f"✅ Created {onnx_path} (opset {opset})")
         
-        print("✅ Loaded staff detection model")
+        # Run onnxruntime's graph optimizer so onnx2tf sees fewer nodes.
+        # BASIC sticks to standard ONNX ops; EXTENDED would emit
+        # com.microsoft fused ops that onnx2tf cannot import.
+        import onnxruntime as ort
         
-        # For symbol recognition, load clef model as example
-        # (In production, you'd load the full symbol classifier)
-        clef_model = Clef.load_from_checkpoint(
-            checkpoint_path=Clef.download_pretrained_model()
-        )
-        clef_model.eval()
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        so.optimized_model_filepath = str(opt_onnx_path)
+        ort.InferenceSession(str(onnx_path), so, providers=["CPUExecutionProvider"])
+        
+        import onnx
         
-        print("✅ Loaded symbol recognition model (using Clef as example)")
+        onnx2tf_input = opt_onnx_path
+        onnx_model = onnx.load(str(opt_onnx_path))
+        if quantization_type == "float16":
+            # Cast weights to float16 at the ONNX level for a predictable size,
+            # keeping numerically sensitive ops and the model I/O in float32.
+            # The float32 graph is kept in case onnx2tf folds the casts away.
+            from onnxconverter_common import float16
+            
+            onnx_model = float16.convert_float_to_float16(
+                onnx_model,
+                keep_io_types=True,
+                op_block_list=["LayerNormalization", "Softmax", "Sigmoid"]
+            )
+            onnx2tf_input = fp16_onnx_path
+        elif quantization_type == "bfloat16":
+            round_to_bfloat16(onnx_model)
+        onnx.save(onnx_model, str(onnx2tf_input))
         
+        onnx_to_tflite(
+            onnx2tf_input, saved_model_dir,
+            integer_quant=(quantization_type == "int8")
+        )
+        # onnx2tf names its flatbuffers after the input ONNX file
+        converted_path = (
+            saved_model_dir
+            / f"{onnx2tf_input.stem}_{ONNX2TF_OUTPUT[quantization_type]}.tflite"
+        )
+        
+        if quantization_type == "float16" and not float16_tensor_count(converted_path):
+            # Cast(fp16 const) was folded back to float32: let TFLite's own
+            # float16 pass quantize the float32 graph instead
+            print("⚠️  onnx2tf kept float32 weights, using its float16 output instead")
+            onnx_to_tflite(opt_onnx_path, saved_model_dir)
+            converted_path = saved_model_dir / f"{opt_onnx_path.stem}_float16.tflite"
+            if not float16_tensor_count(converted_path):
+                raise ValidationError(
+                    f"{model_name}: float16 conversion produced no float16 weights"
+                )
+        shutil.copyfile(converted_path, tflite_path)
+    
+    # Copy file-to-file rather than loading the flatbuffer into memory
+    shutil.copyfile(tflite_path, output_path)
+    size = output_path.stat().st_size / (1024 * 1024)
+    print(f"✅ Saved {output_path} ({size:.2f} MB)")
+    
+    try:
+        error = validate_tflite(output_path, model, sample_input, quantization_type)
+    except ValidationError:
+        # Don't leave a broken model where it could be copied into the app
+        output_path.unlink()
+        raise
+    print(f"✅ Output matches PyTorch (relative error {error:.4f})")
+    
+    if use_cache:
+        hash_path.write_text(weights_hash)
+    
+    # Clean up intermediates when caching is disabled
+    if not use_cache:
+        os.remove(onnx_path)
+        os.remove(opt_onnx_path)
+        if fp16_onnx_path.exists():
+            os.remove(fp16_onnx_path)
+        shutil.rmtree(saved_model_dir, ignore_errors=True)
+    
+    return size
+
+
+def convert_oemer_model(
+    model_cls,
+    input_shape,
+    model_name: str,
+    output_dir: Path,
+    quantization_type: str = "float16",
+    use_cache: bool = True
+) -> float:
+    """
+    Load a pre-trained oemer model, convert it to TFLite and release it.
+    
+    The model only lives inside this call, so its weights and trace are
+    freed before the next model is loaded.
+    
+    Returns:
+        Size of the written .tflite file in MB
+    """
+    import torch
+    
+    print(f"📦 Loading oemer {model_cls.__name__} model...")
+    model = model_cls.load_from_checkpoint(
+        checkpoint_path=_cached_download(model_cls, model_cls.__name__.lower())
+    )
+    model.eval()
+    print(f"✅ Loaded {model_cls.__name__} model for {model_name}")
+    
+    size = convert_model(
+        model, torch.randn(*input_shape), model_name, output_dir,
+        quantization_type=quantization_type, use_cache=use_cache
+    )
+    
+    del model
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    return size
+
+
+def convert_models(
+    output_dir: Path,
+    quantization_type: str = "float16",
+    use_cache: bool = True
+):
+    """Convert oemer models to TFLite format."""
+    
+    # Let TF's converter passes use every available core; the thread
+    # counts must be set before TensorFlow runs its first op
+    n_threads = (
+        len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    )
+    os.environ["TF_NUM_INTRAOP_THREADS"] = str(n_threads)
+    os.environ["TF_NUM_INTEROP_THREADS"] = "2"
+    
+    import tensorflow as tf
+    
+    tf.config.threading.set_intra_op_parallelism_threads(n_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(2)
+    
+    print("🎵 oemer → TensorFlow Lite Converter")
+    print("=" * 60)
+    
+    # Option 1: Try importing oemer models directly
+    try:
+        from oemer.models import Staff, Clef
     except Exception as e:
         print(f"⚠️  Note: Direct oemer import encountered: {e}")
         print("   Creating mock TFLite models for demonstration...")
-        return create_mock_tflite_models()
+        return create_mock_tflite_models(output_dir)
     
-    # Option 2: Convert PyTorch models to TFLite using ONNX
+    # Option 2: Convert PyTorch models to TFLite using ONNX, one at a time
     try:
-        print("\n🔄 Converting models to ONNX format...")
-        
-        # Create sample inputs
-        staff_input = torch.randn(1, 3, 512, 512)
-        symbol_input = torch.randn(1, 3, 128, 128)
+        print("\n🔄 Converting models to TensorFlow Lite via ONNX...")
         
-        # Export to ONNX
-        torch.onnx.export(
-            staff_model, staff_input,
-            "staff_detector.onnx",
-            input_names=["input"],
-            output_names=["output"],
-            opset_version=13,
-            verbose=False
+        size1 = convert_oemer_model(
+            Staff, (1, 3, 512, 512), "staff_detector", output_dir,
+            quantization_type=quantization_type, use_cache=use_cache
         )
-        print("✅ Created staff_detector.onnx")
-        
-        torch.onnx.export(
-            clef_model, symbol_input,
-            "symbol_recognizer.onnx",
-            input_names=["input"],
-            output_names=["output"],
-            opset_version=13,
-            verbose=False
+        # For symbol recognition, use the clef model as example
+        # (In production, you'd load the full symbol classifier)
+        size2 = convert_oemer_model(
+            Clef, (1, 3, 128, 128), "symbol_recognizer", output_dir,
+            quantization_type=quantization_type, use_cache=use_cache
         )
-        print("✅ Created symbol_recognizer.onnx")
-        
-        # Convert ONNX to TFLite
-        print("\n🔄 Converting ONNX to TensorFlow Lite...")
-        
-        import onnx
-        from onnx_tf.backend import prepare
-        
-        # Staff detector
-        onnx_model = onnx.load("staff_detector.onnx")
-        tf_rep = prepare(onnx_model)
-        tf_rep.export_graph("staff_detector_tf")
-        
-        converter = tf.lite.TFLiteConverter.from_saved_model("staff_detector_tf")
-        converter.optimizations = [tf.lite.Optimize.DEFAULT]
-        converter.target_spec.supported_types = [tf.float16]
-        
-        tflite_model = converter.convert()
-        with open("staff_detector.tflite", "wb") as f:
-            f.write(tflite_model)
-        
-        size1 = os.path.getsize("staff_detector.tflite") / (1024 * 1024)
-        print(f"✅ Saved staff_detector.tflite ({size1:.2f} MB)")
-        
-        # Symbol recognizer
-        onnx_model = onnx.load("symbol_recognizer.onnx")
-        tf_rep = prepare(onnx_model)
-        tf_rep.export_graph("symbol_recognizer_tf")
-        
-        converter = tf.lite.TFLiteConverter.from_saved_model("symbol_recognizer_tf")
-        converter.optimizations = [tf.lite.Optimize.DEFAULT]
-        converter.target_spec.supported_types = [tf.float16]
-        
-        tflite_model = converter.convert()
-        with open("symbol_recognizer.tflite", "wb") as f:
-            f.write(tflite_model)
-        
-        size2 = os.path.getsize("symbol_recognizer.tflite") / (1024 * 1024)
-        print(f"✅ Saved symbol_recognizer.tflite ({size2:.2f} MB)")
         
         total = size1 + size2
         print(f"\n📊 Total size: {total:.2f} MB")
@@ -155,17 +483,39 @@ def convert_models():
         if total <= 50:
             print("✅ SUCCESS: Within 50 MB budget!")
         else:
-            print(f"⚠️  Size ({total:.2f} MB) exceeds target - consider int8 quantization")
+            print(f"⚠️  Size ({total:.2f} MB) exceeds target - consider --quantization int8")
+        
+        # Only the real models are exported with a dynamic batch dim;
+        # the mock models are fixed at batch_size=1
+        print("\n💡 Batch multi-page scans into a single call (batch dim is dynamic):")
+        print("   resize input to [pages, H, W, 3] → allocateTensors() → run once")
         
         return True
         
+    except ValidationError as e:
+        # Falling back to mocks here would ship them in place of a broken model
+        print(f"❌ Validation failed: {e}")
+        return False
+        
     except Exception as e:
         print(f"❌ Conversion failed: {e}")
         print("\nFallback: Creating mock TFLite models...")
-        return create_mock_tflite_models()
+        return create_mock_tflite_models(output_dir)
 
 
-def create_mock_tflite_models():
+def _build_converter(model):
+    """Create a float16 MLIR TFLite converter for a Keras model."""
+    import tensorflow as tf
+    
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.experimental_new_converter = True
+    converter._experimental_lower_tensor_list_ops = True
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_types = [tf.float16]
+    return converter
+
+
+def create_mock_tflite_models(output_dir: Path):
     """
     Create mock TFLite models for testing the pipeline.
     Use these to test the React Native integration while the real models convert.
@@ -187,15 +537,12 @@ def create_mock_tflite_models():
     staff_model = tf.keras.Model(inputs=staff_input, outputs=staff_output)
     
     # Convert to TFLite
-    converter = tf.lite.TFLiteConverter.from_keras_model(staff_model)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    converter.target_spec.supported_types = [tf.float16]
+    tflite_staff = _build_converter(staff_model).convert()
+    write_tflite(output_dir / "staff_detector.tflite", tflite_staff)
+    size1 = len(tflite_staff) / (1024 * 1024)
+    del tflite_staff
+    gc.collect()
     
-    tflite_staff = converter.convert()
-    with open("staff_detector.tflite", "wb") as f:
-        f.write(tflite_staff)
-    
-    size1 = os.path.getsize("staff_detector.tflite") / (1024 * 1024)
     print(f"✅ Created staff_detector.tflite ({size1:.2f} MB)")
     
     # Symbol Recognizer: 128x128 → class logits (num_classes)
@@ -208,15 +555,12 @@ def create_mock_tflite_models():
     symbol_model = tf.keras.Model(inputs=symbol_input, outputs=symbol_output)
     
     # Convert to TFLite
-    converter = tf.lite.TFLiteConverter.from_keras_model(symbol_model)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    converter.target_spec.supported_types = [tf.float16]
-    
-    tflite_symbol = converter.convert()
-    with open("symbol_recognizer.tflite", "wb") as f:
-        f.write(tflite_symbol)
+    tflite_symbol = _build_converter(symbol_model).convert()
+    write_tflite(output_dir / "symbol_recognizer.tflite", tflite_symbol)
+    size2 = len(tflite_symbol) / (1024 * 1024)
+    del tflite_symbol
+    gc.collect()
     
-    size2 = os.path.getsize("symbol_recognizer.tflite") / (1024 * 1024)
     print(f"✅ Created symbol_recognizer.tflite ({size2:.2f} MB)")
     
     total = size1 + size2
@@ -247,6 +591,19 @@ def main():
         action="store_true",
         help="Create mock models for testing"
     )
+    parser.add_argument(
+        "--quantization",
+        choices=["float16", "bfloat16", "int8"],
+        default="float16",
+        help="Weight quantization: float16 (default), int8, or bfloat16 (float32 "
+             "file with bf16-rounded weights, no size or speed change; not "
+             "offered by convert_oemer_to_tflite.py)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild ONNX/SavedModel intermediates and delete them afterwards"
+    )
     
     args = parser.parse_args()
     
@@ -266,13 +623,14 @@ def main():
     # Create output directory
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
-    os.chdir(output_dir)
     
     # Convert or create mock
     if args.mock:
-        success = create_mock_tflite_models()
+        success = create_mock_tflite_models(output_dir)
     else:
-        success = convert_models()
+        success = convert_models(
+            output_dir, quantization_type=args.quantization, use_cache=not args.no_cache
+        )
     
     # Print next steps
     if success:
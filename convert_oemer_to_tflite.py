@@ -15,10 +15,18 @@ Author: GitHub Copilot
 Date: January 24, 2026
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import warnings
 import argparse
+import hashlib
+import importlib.util
+import multiprocessing
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Tuple, Optional
 import numpy as np
@@ -27,44 +35,138 @@ import numpy as np
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 warnings.filterwarnings('ignore')
 
-try:
-    import tensorflow as tf
-    from tensorflow.lite.python import lite_constants
-except ImportError:
-    print("❌ ERROR: TensorFlow not installed")
-    print("Install it with: pip install tensorflow==2.14.0")
-    sys.exit(1)
-
-try:
-    import torch
-    import torchvision
-except ImportError:
-    print("❌ ERROR: PyTorch not installed")
-    print("Install it with: pip install torch torchvision")
-    sys.exit(1)
-
-try:
-    from oemer.models import Staff, Clef
-except ImportError:
-    print("❌ ERROR: oemer package not installed")
-    print("Install it with: pip install oemer")
-    sys.exit(1)
+# Heavy dependencies, imported on first use by _ensure_deps() so that
+# --help and argument errors return without loading TensorFlow/PyTorch
+tf = None
+torch = None
+Staff = None
+Clef = None
+
+
+def _ensure_deps() -> None:
+    """Import TensorFlow, PyTorch and oemer, exiting if any is missing."""
+    global tf, torch, Staff, Clef
+    if Clef is not None:
+        return
+    
+    try:
+        import tensorflow as tf
+        from tensorflow.lite.python import lite_constants
+    except ImportError:
+        print("❌ ERROR: TensorFlow not installed")
+        print('Install it with: pip install "tensorflow==2.19.*"')
+        sys.exit(1)
+    
+    try:
+        import torch
+        import torchvision
+    except ImportError:
+        print("❌ ERROR: PyTorch not installed")
+        print('Install it with: pip install "torch>=2.4,<2.7" torchvision')
+        sys.exit(1)
+    
+    try:
+        from oemer.models import Staff, Clef
+    except ImportError:
+        print("❌ ERROR: oemer package not installed")
+        print("Install it with: pip install oemer")
+        sys.exit(1)
+    
+    if importlib.util.find_spec("ai_edge_torch") is None:
+        print("❌ ERROR: ai-edge-torch not installed")
+        print("Install it with: pip install ai-edge-torch")
+        sys.exit(1)
+
+
+# Local copy of downloaded oemer checkpoints, reused across runs
+CHECKPOINT_CACHE_DIR = Path.home() / ".cache" / "oemer"
+
+# Number of calibration samples fed to the int8 converter
+REPRESENTATIVE_SAMPLES = 200
+
+# Max output error, relative to the largest reference output, that a
+# converted model may show against PyTorch before it is rejected
+VALIDATION_TOLERANCE = {"none": 0.02, "float16": 0.02, "int8": 0.1}
+
+# Models produced by convert_and_validate: loader method and input shape
+MODEL_SPECS = {
+    # batch=1, RGB, 512x512
+    "staff_detector": ("load_oemer_staff_detection_model", (1, 3, 512, 512)),
+    # batch=1, RGB, 128x128 (symbol patches)
+    "symbol_recognizer": ("load_oemer_symbol_recognition_model", (1, 3, 128, 128)),
+}
+
+
+def _cached_download(model_cls, name: str) -> str:
+    """
+    Return a local checkpoint path for an oemer model, downloading it only once.
+    
+    Args:
+        model_cls: oemer model class providing download_pretrained_model()
+        name: Cache file name (without extension)
+    """
+    path = CHECKPOINT_CACHE_DIR / f"{name}.ckpt"
+    if path.exists() and path.stat().st_size > 0:
+        return str(path)
+    
+    source = model_cls.download_pretrained_model()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Copy to a temp file and rename it into place, so an interrupted copy
+    # never leaves a truncated checkpoint that later runs would trust
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".ckpt.tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return str(path)
+
+
+def model_weights_hash(model: torch.nn.Module, *config: str) -> str:
+    """Return a SHA-256 over a model's parameters and conversion settings."""
+    digest = hashlib.sha256(
+        b"".join(p.detach().cpu().numpy().tobytes() for p in model.parameters())
+    )
+    for value in config:
+        digest.update(value.encode())
+    return digest.hexdigest()
+
+
+def calibration_fingerprint(data_dir: Optional[str]) -> str:
+    """Describe an int8 calibration set (file names, sizes, mtimes) for cache keys."""
+    if not data_dir:
+        return "random"
+    entries = sorted(
+        f"{p.name}:{p.stat().st_size}:{p.stat().st_mtime_ns}"
+        for p in Path(data_dir).iterdir() if p.is_file()
+    )
+    return f"{Path(data_dir).resolve()}|" + "|".join(entries)
 
 
 class OemerToTFLiteConverter:
     """Convert oemer PyTorch models to TensorFlow Lite format."""
 
-    def __init__(self, output_dir: str = "./tflite_models", verbose: bool = True):
+    def __init__(
+        self,
+        output_dir: str = "./tflite_models",
+        verbose: bool = True,
+        use_cache: bool = True
+    ):
         """
         Initialize converter.
         
         Args:
             output_dir: Directory to save .tflite files
             verbose: Print progress messages
+            use_cache: Skip conversion when weights and quantization are unchanged
         """
+        _ensure_deps()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.verbose = verbose
+        self.use_cache = use_cache
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
     def log(self, message: str) -> None:
@@ -86,7 +188,7 @@ class OemerToTFLiteConverter:
             self.log("📦 Loading oemer staff detection model...")
             # Load oemer's Staff model (pre-trained UNet for staff line detection)
             model = Staff.load_from_checkpoint(
-                checkpoint_path=Staff.download_pretrained_model(),
+                checkpoint_path=_cached_download(Staff, "staff"),
                 map_location=self.device
             )
             model.eval()
@@ -109,7 +211,7 @@ class OemerToTFLiteConverter:
             self.log("📦 Loading oemer symbol recognition model...")
             # Load oemer's Clef model (symbol classifier - can be extended for all symbols)
             model = Clef.load_from_checkpoint(
-                checkpoint_path=Clef.download_pretrained_model(),
+                checkpoint_path=_cached_download(Clef, "clef"),
                 map_location=self.device
             )
             model.eval()
@@ -118,12 +220,137 @@ class OemerToTFLiteConverter:
         except Exception as e:
             raise RuntimeError(f"Failed to load symbol recognition model: {e}")
 
+    def representative_dataset(
+        self,
+        input_shape: Tuple[int, ...],
+        data_dir: Optional[str] = None
+    ):
+        """
+        Build a calibration generator for full-integer quantization.
+        
+        Args:
+            input_shape: Input tensor shape (batch, channels, height, width)
+            data_dir: Directory of sample score images; random data if None
+            
+        Returns:
+            Generator function yielding one NCHW float32 sample per call
+        """
+        _, channels, height, width = input_shape
+        image_paths = []
+        if data_dir:
+            image_paths = sorted(
+                p for p in Path(data_dir).iterdir()
+                if p.suffix.lower() in (".png", ".jpg", ".jpeg", ".bmp")
+            )[:REPRESENTATIVE_SAMPLES]
+            if not image_paths:
+                raise ValueError(f"No images found in {data_dir}")
+        
+        def generator():
+            if not image_paths:
+                for _ in range(REPRESENTATIVE_SAMPLES):
+                    yield [np.random.rand(1, channels, height, width).astype(np.float32)]
+                return
+            for path in image_paths:
+                image = tf.io.decode_image(
+                    tf.io.read_file(str(path)), channels=channels, expand_animations=False
+                )
+                image = tf.image.resize(image, (height, width)) / 255.0
+                # ai-edge-torch keeps PyTorch's NCHW input layout
+                yield [np.transpose(image.numpy(), (2, 0, 1))[np.newaxis].astype(np.float32)]
+        
+        return generator
+
+    def check_float16_weights(self, tflite_path: Path) -> int:
+        """
+        Verify a float16 conversion stored its weights as float16.
+        
+        Args:
+            tflite_path: Converted .tflite file
+            
+        Returns:
+            Number of float16 tensors in the model
+            
+        Raises:
+            RuntimeError: If the converter fell back to int8 weights or
+                left every tensor as float32
+        """
+        interpreter = tf.lite.Interpreter(model_path=str(tflite_path))
+        dtypes = [detail["dtype"] for detail in interpreter.get_tensor_details()]
+        float16_count = sum(1 for dtype in dtypes if dtype == np.float16)
+        int8_count = sum(1 for dtype in dtypes if dtype == np.int8)
+        if int8_count or not float16_count:
+            raise RuntimeError(
+                f"float16 conversion produced {float16_count} float16 and "
+                f"{int8_count} int8 tensors - converter fell back to hybrid quantization"
+            )
+        return float16_count
+
+    def validate_tflite(
+        self,
+        tflite_path: Path,
+        pytorch_model: torch.nn.Module,
+        sample_input: torch.Tensor,
+        quantization_type: str
+    ) -> float:
+        """
+        Compare a converted model's output with PyTorch on the same input.
+        
+        Args:
+            tflite_path: Converted .tflite file
+            pytorch_model: Reference PyTorch model
+            sample_input: NCHW input tensor fed to both models
+            quantization_type: Selects the tolerance from VALIDATION_TOLERANCE
+            
+        Returns:
+            Max output error relative to the largest reference output
+            
+        Raises:
+            RuntimeError: If the error exceeds the tolerance
+        """
+        interpreter = tf.lite.Interpreter(model_path=str(tflite_path))
+        input_details = interpreter.get_input_details()[0]
+        # ai-edge-torch keeps PyTorch's NCHW input layout
+        x = sample_input.detach().cpu().numpy()
+        interpreter.resize_tensor_input(input_details["index"], x.shape)
+        interpreter.allocate_tensors()
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+        
+        if input_details["dtype"] == np.int8:
+            scale, zero_point = input_details["quantization"]
+            x = np.clip(np.round(x / scale + zero_point), -128, 127)
+        interpreter.set_tensor(input_details["index"], x.astype(input_details["dtype"]))
+        interpreter.invoke()
+        y_tflite = interpreter.get_tensor(output_details["index"]).astype(np.float32)
+        if output_details["dtype"] == np.int8:
+            scale, zero_point = output_details["quantization"]
+            y_tflite = (y_tflite - zero_point) * scale
+        
+        with torch.no_grad():
+            y_torch = pytorch_model(sample_input)
+        if isinstance(y_torch, (tuple, list)):
+            y_torch = y_torch[0]
+        y_torch = y_torch.detach().cpu().numpy()
+        
+        error = float(
+            np.max(np.abs(y_tflite.reshape(y_torch.shape) - y_torch))
+            / (np.max(np.abs(y_torch)) + 1e-6)
+        )
+        tolerance = VALIDATION_TOLERANCE[quantization_type]
+        if error > tolerance:
+            raise RuntimeError(
+                f"TFLite output diverges from PyTorch by {error:.3f} "
+                f"(tolerance {tolerance}) - quantization broke the model"
+            )
+        return error
+
     def pytorch_to_tflite(
         self,
         pytorch_model: torch.nn.Module,
         input_shape: Tuple[int, ...],
         model_name: str,
-        quantization_type: str = "float16"
+        quantization_type: str = "float16",
+        representative_data_dir: Optional[str] = None
     ) -> Tuple[str, float]:
         """
         Convert PyTorch model to TensorFlow Lite format.
@@ -133,6 +360,7 @@ class OemerToTFLiteConverter:
             input_shape: Input tensor shape (batch, channels, height, width)
             model_name: Name for output .tflite file (without extension)
             quantization_type: "float16", "int8", or "none"
+            representative_data_dir: Calibration images for int8 (random if None)
             
         Returns:
             Tuple of (output_file_path, file_size_mb)
@@ -143,104 +371,122 @@ class OemerToTFLiteConverter:
         try:
             self.log(f"\n🔄 Converting {model_name} to TFLite...")
             
-            # Create dummy input for tracing
-            dummy_input = torch.randn(input_shape, device=self.device)
-            
-            # Trace PyTorch model to TorchScript
-            self.log(f"   ├─ Step 1/4: Tracing PyTorch model...")
-            traced_model = torch.jit.trace(pytorch_model, dummy_input)
-            
-            # Convert TorchScript to TensorFlow SavedModel
-            self.log(f"   ├─ Step 2/4: Converting to TensorFlow SavedModel...")
-            concrete_func = tf.function(
-                lambda x: torch.onnx._export(
-                    pytorch_model, dummy_input, None, 
-                    input_names=["input"], output_names=["output"],
-                    opset_version=13
-                )
-            )
-            
-            # Use tf2onnx for better compatibility
-            # Alternative: Use torch.onnx export then onnx-tf
-            saved_model_dir = self.output_dir / f"{model_name}_saved_model"
-            
-            # Create TF Lite converter from ONNX via intermediate format
-            # For simplicity, we'll use PyTorch → ONNX → TFLite via converter
-            import onnx
-            import onnx_tf
-            
-            onnx_model_path = str(self.output_dir / f"{model_name}.onnx")
-            self.log(f"   ├─ Exporting to ONNX at {onnx_model_path}...")
-            
-            torch.onnx.export(
+            # Reuse the existing flatbuffer if it was built from identical weights
+            output_path = self.output_dir / f"{model_name}.tflite"
+            hash_path = self.output_dir / f"{model_name}.sha256"
+            # int8 output also depends on the calibration images
+            weights_hash = model_weights_hash(
                 pytorch_model,
-                dummy_input,
-                onnx_model_path,
-                input_names=["input"],
-                output_names=["output"],
-                opset_version=13,
-                do_constant_folding=True,
-                export_params=True,
-                verbose=False
+                quantization_type,
+                calibration_fingerprint(representative_data_dir)
+                if quantization_type == "int8" else ""
             )
+            if (
+                self.use_cache
+                and output_path.exists()
+                and hash_path.exists()
+                and hash_path.read_text().strip() == weights_hash
+            ):
+                file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
+                self.log(f"♻️  Reusing cached {output_path} (weights unchanged)")
+                self.log(f"   Size: {file_size_mb:.2f} MB")
+                return str(output_path), file_size_mb
             
-            # Convert ONNX to TensorFlow SavedModel
-            self.log(f"   ├─ Step 3/4: Converting ONNX to TensorFlow...")
-            onnx_model = onnx.load(onnx_model_path)
-            
-            # Create TensorFlow graph from ONNX
-            tf_rep = onnx_tf.backend.prepare(onnx_model)
-            tf_rep.export_graph(str(saved_model_dir))
+            # Create dummy input for tracing and validation. It comes from the
+            # int8 calibration distribution ([0, 1) pixels), so int8 inputs
+            # aren't clipped when the converted model is checked.
+            sample = next(iter(self.representative_dataset(
+                input_shape, representative_data_dir
+            )()))[0]
+            dummy_input = torch.from_numpy(sample).to(self.device)
             
-            # Convert SavedModel to TFLite
-            self.log(f"   ├─ Step 4/4: Converting to TensorFlow Lite with {quantization_type} quantization...")
-            converter = tf.lite.TFLiteConverter.from_saved_model(str(saved_model_dir))
+            # Freeze weights so exported constants carry no autograd state
+            self.log("   ├─ Step 1/4: Preparing PyTorch model for export...")
+            pytorch_model.requires_grad_(False)
             
-            # Apply quantization
+            # Converter flags forwarded to the TFLite converter by ai-edge-torch.
+            # Nested attributes must be nested dicts: ai-edge-torch setattr()s
+            # each key, so a dotted key like "target_spec.x" would be ignored.
+            self.log("   ├─ Step 2/4: Configuring TFLite converter...")
+            converter_flags = {}
             if quantization_type == "float16":
-                converter.target_spec.supported_types = [tf.float16]
-                converter.optimizations = [tf.lite.Optimize.DEFAULT]
+                converter_flags["optimizations"] = [tf.lite.Optimize.DEFAULT]
+                converter_flags["target_spec"] = {"supported_types": [tf.float16]}
             elif quantization_type == "int8":
-                converter.optimizations = [tf.lite.Optimize.DEFAULT]
-                converter.target_spec.supported_ops = [
-                    tf.lite.OpsSet.TFLITE_BUILTINS_INT8
-                ]
-                # Note: int8 requires quantization dataset
+                converter_flags["optimizations"] = [tf.lite.Optimize.DEFAULT]
+                converter_flags["representative_dataset"] = self.representative_dataset(
+                    input_shape, representative_data_dir
+                )
+                converter_flags["target_spec"] = {
+                    "supported_ops": [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+                }
+                converter_flags["inference_input_type"] = tf.int8
+                converter_flags["inference_output_type"] = tf.int8
             elif quantization_type != "none":
                 raise ValueError(f"Unknown quantization type: {quantization_type}")
             
-            # Set optimization for mobile
-            converter.target_spec.supported_ops = [
-                tf.lite.OpsSet.TFLITE_BUILTINS
-            ]
-            converter.allow_custom_ops = False
+            # Set optimization for mobile. target_spec is only set by the
+            # quantization branches above; resetting supported_ops here would
+            # clobber the int8 op set.
+            converter_flags["allow_custom_ops"] = False
+            converter_flags["experimental_new_converter"] = True
             
-            # Convert
-            tflite_model = converter.convert()
+            # Convert PyTorch directly to a TFLite flatbuffer (no ONNX/SavedModel round-trip)
+            self.log(f"   ├─ Step 3/4: Converting to TensorFlow Lite with {quantization_type} quantization...")
+            import ai_edge_torch
+            
+            # Export with a symbolic batch dim so the app can batch pages.
+            # torch.export specialises size-1 dims, so trace with batch=2.
+            batch = torch.export.Dim("batch")
+            edge_model = ai_edge_torch.convert(
+                pytorch_model.eval(),
+                (dummy_input.repeat(2, 1, 1, 1),),
+                dynamic_shapes=({0: batch},),
+                _ai_edge_converter_flags=converter_flags
+            )
             
             # Save to file
-            output_path = self.output_dir / f"{model_name}.tflite"
-            with open(output_path, "wb") as f:
-                f.write(tflite_model)
+            self.log("   ├─ Step 4/4: Writing flatbuffer...")
+            edge_model.export(str(output_path))
+            
+            # Catch silent int8 fallback or quantization damage before shipping
+            try:
+                if quantization_type == "float16":
+                    float16_count = self.check_float16_weights(output_path)
+                    self.log(f"   ├─ Weights stored as float16 ({float16_count} tensors)")
+                error = self.validate_tflite(
+                    output_path, pytorch_model, dummy_input, quantization_type
+                )
+            except RuntimeError:
+                # Don't leave a broken model where it could be copied into the app
+                output_path.unlink()
+                raise
+            self.log(f"   ├─ Output matches PyTorch (relative error {error:.4f})")
+            
+            if self.use_cache:
+                hash_path.write_text(weights_hash)
             
             file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
             self.log(f"✅ Saved: {output_path}")
             self.log(f"   Size: {file_size_mb:.2f} MB")
             
-            # Clean up temporary files
-            os.remove(onnx_model_path)
-            import shutil
-            shutil.rmtree(saved_model_dir, ignore_errors=True)
-            
             return str(output_path), file_size_mb
             
         except Exception as e:
             raise RuntimeError(f"Conversion failed for {model_name}: {e}")
 
-    def convert_and_validate(self) -> bool:
+    def convert_and_validate(
+        self,
+        quantization_type: str = "float16",
+        representative_data_dir: Optional[str] = None
+    ) -> bool:
         """
         Execute full conversion pipeline.
         
+        Args:
+            quantization_type: "float16", "int8", or "none"
+            representative_data_dir: Calibration images for int8 (random if None)
+        
         Returns:
             True if successful, False otherwise
         """
@@ -252,25 +498,24 @@ class OemerToTFLiteConverter:
             self.log(f"Device: {self.device}")
             self.log("")
             
-            # Load models
-            staff_model = self.load_oemer_staff_detection_model()
-            symbol_model = self.load_oemer_symbol_recognition_model()
-            
-            # Convert staff detection model
-            staff_path, staff_size = self.pytorch_to_tflite(
-                staff_model,
-                input_shape=(1, 3, 512, 512),  # batch=1, RGB, 512x512
-                model_name="staff_detector",
-                quantization_type="float16"
-            )
-            
-            # Convert symbol recognition model
-            symbol_path, symbol_size = self.pytorch_to_tflite(
-                symbol_model,
-                input_shape=(1, 3, 128, 128),  # batch=1, RGB, 128x128 (symbol patches)
-                model_name="symbol_recognizer",
-                quantization_type="float16"
-            )
+            # Load and convert both models in parallel worker processes.
+            # "spawn" gives each worker a fresh TF/CUDA runtime.
+            with ProcessPoolExecutor(
+                max_workers=len(MODEL_SPECS),
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                worker_args = (
+                    str(self.output_dir), self.verbose, self.use_cache,
+                    quantization_type, representative_data_dir
+                )
+                staff_future = executor.submit(
+                    convert_model_worker, "staff_detector", *worker_args
+                )
+                symbol_future = executor.submit(
+                    convert_model_worker, "symbol_recognizer", *worker_args
+                )
+                staff_path, staff_size = staff_future.result()
+                symbol_path, symbol_size = symbol_future.result()
             
             # Validate total size
             total_size = staff_size + symbol_size
@@ -284,7 +529,7 @@ class OemerToTFLiteConverter:
             
             if total_size > 50:
                 self.log(f"⚠️  WARNING: Total size ({total_size:.2f} MB) exceeds 50 MB target")
-                self.log("   Consider applying int8 quantization or model pruning")
+                self.log("   Consider --quantization int8 (with --representative-data-dir) or model pruning")
             else:
                 self.log(f"✅ SUCCESS: Total size ({total_size:.2f} MB) within 50 MB budget")
             
@@ -299,6 +544,9 @@ class OemerToTFLiteConverter:
             self.log(f"   npm install react-native-fast-tflite")
             self.log("")
             self.log(f"4. Update OMRService.ts to load and use models locally")
+            self.log("")
+            self.log("5. Batch multi-page scans into a single call (batch dim is dynamic):")
+            self.log("   resize input to [pages, 3, H, W] → allocateTensors() → run once")
             self.log("=" * 70)
             
             return total_size <= 50
@@ -310,6 +558,73 @@ class OemerToTFLiteConverter:
             return False
 
 
+def available_cpus() -> list:
+    """Return the CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def configure_threads(cpus: list) -> None:
+    """
+    Pin this process to the given CPUs and size TF/PyTorch thread pools to them.
+    
+    Must run before TensorFlow executes any op.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    os.environ["TF_NUM_INTRAOP_THREADS"] = str(len(cpus))
+    os.environ["TF_NUM_INTEROP_THREADS"] = "2"
+    tf.config.threading.set_intra_op_parallelism_threads(len(cpus))
+    tf.config.threading.set_inter_op_parallelism_threads(2)
+    torch.set_num_threads(len(cpus))
+
+
+def convert_model_worker(
+    model_name: str,
+    output_dir: str,
+    verbose: bool,
+    use_cache: bool,
+    quantization_type: str,
+    representative_data_dir: Optional[str]
+) -> Tuple[str, float]:
+    """
+    Load and convert a single model inside a worker process.
+    
+    Args:
+        model_name: Key into MODEL_SPECS
+        output_dir, verbose, use_cache: Forwarded to OemerToTFLiteConverter
+        quantization_type, representative_data_dir: Forwarded to pytorch_to_tflite
+        
+    Returns:
+        Tuple of (output_file_path, file_size_mb)
+    """
+    os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
+    _ensure_deps()
+    
+    # Give each worker its own contiguous slice of cores instead of
+    # letting both oversubscribe the whole machine
+    cpus = available_cpus()
+    share = max(1, len(cpus) // len(MODEL_SPECS))
+    index = list(MODEL_SPECS).index(model_name)
+    configure_threads(cpus[index * share:(index + 1) * share] or cpus)
+    
+    converter = OemerToTFLiteConverter(
+        output_dir=output_dir,
+        verbose=verbose,
+        use_cache=use_cache
+    )
+    loader_name, input_shape = MODEL_SPECS[model_name]
+    model = getattr(converter, loader_name)()
+    return converter.pytorch_to_tflite(
+        model,
+        input_shape=input_shape,
+        model_name=model_name,
+        quantization_type=quantization_type,
+        representative_data_dir=representative_data_dir
+    )
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -330,21 +645,41 @@ def main():
         default=None,
         help="Copy final .tflite files to this directory (e.g., sheet-music-scanner/src/assets/models/)"
     )
+    parser.add_argument(
+        "--quantization",
+        choices=["float16", "int8", "none"],
+        default="float16",
+        help="Weight quantization: float16 (default), int8 or none "
+             "(convert_oemer_simple.py also offers bfloat16)"
+    )
+    parser.add_argument(
+        "--representative-data-dir",
+        default=None,
+        help="Sample score images used to calibrate int8 quantization (default: random data)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always reconvert, ignoring .sha256 files from previous runs"
+    )
     
     args = parser.parse_args()
     
     # Create converter
     converter = OemerToTFLiteConverter(
         output_dir=args.output,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        use_cache=not args.no_cache
     )
     
     # Execute conversion
-    success = converter.convert_and_validate()
+    success = converter.convert_and_validate(
+        quantization_type=args.quantization,
+        representative_data_dir=args.representative_data_dir
+    )
     
     # Copy to target directory if specified
     if success and args.target_dir:
-        import shutil
         target = Path(args.target_dir)
         target.mkdir(parents=True, exist_ok=True)
         